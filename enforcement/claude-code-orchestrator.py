@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+Claude Code Orchestrator for the RALPH pipeline
+
+Semi-automated loop controller for design-ops gates:
+1. Runs design-ops validation for a gate
+2. If FAIL: prints the instruction summary
+3. Waits for the user to spawn a Claude Code agent and fix issues
+4. Re-validates until PASS (max iterations reached)
+
+Usage:
+    python claude-code-orchestrator.py run-gate <gate> <target-file>
+    python claude-code-orchestrator.py run-pipeline <req-dir> [output-dir]
+    python claude-code-orchestrator.py validate-spec <spec-file>
+
+Requires Python 3.7+. No external dependencies.
+
+See ORCHESTRATORS.md for the comparison with the Cursor orchestrator.
+"""
+
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+# Heavier imports (argparse, subprocess, concurrent.futures, hashlib, mmap,
+# selectors, shlex) are deferred to the code paths that use them, so
+# importing this module and dispatching a command stays cheap.
+
+DEFAULT_MAX_ITERATIONS = 5
+
+# Resolved once at import: __file__ never moves during a run.
+SCRIPT_DIR = Path(__file__).parent
+
+@dataclass(frozen=True)
+class Gate:
+    """One design-ops gate: an immutable row of the GATES table.
+
+    Frozen + __slots__: rows are shared constants, so no per-instance
+    __dict__ and no accidental mutation from gate runners.
+    """
+
+    __slots__ = ("gate_id", "name", "description", "max_iterations")
+
+    gate_id: int
+    name: str
+    description: str
+    max_iterations: int
+
+
+# Gate table, indexed by integer gate_id.
+# max_iterations mirrors run_full_pipeline in lib/gate-runners.sh
+GATES = (
+    Gate(0, "create-spec", "Create spec from requirements directory", 5),
+    Gate(1, "stress-test", "Check spec completeness", 5),
+    Gate(2, "validate", "Validate spec against 43 invariants", 5),
+    Gate(3, "security-scan", "Check spec against security rules", 5),
+    Gate(4, "generate", "Generate PRP from validated spec", 5),
+    Gate(5, "check", "Validate PRP structure", 5),
+    Gate(6, "generate-tests", "Generate test suite from PRP", 5),
+    Gate(7, "implement-tdd", "Implement code to pass tests (TDD loop)", 10),
+    Gate(8, "parallel-checks", "Build / lint / integration / a11y checks", 5),
+    Gate(9, "smoke-test", "E2E critical path tests", 5),
+    Gate(10, "ai-review", "AI security and quality review", 5),
+)
+
+GATES_BY_NAME = {gate.name: gate for gate in GATES}
+
+# Full pipeline: gate -> target template (same 10 gates as run_full_pipeline
+# in lib/gate-runners.sh; two-argument gates use "first:second" targets)
+PIPELINE = [
+    ("create-spec", "{req_dir}:{spec_file}"),
+    ("stress-test", "{spec_file}"),
+    ("validate", "{spec_file}"),
+    ("generate", "{spec_file}"),
+    ("check", "{prp_file}"),
+    ("generate-tests", "{prp_file}"),
+    ("implement-tdd", "{test_dir}"),
+    ("parallel-checks", "{output_dir}"),
+    ("smoke-test", "{output_dir}"),
+    ("ai-review", "{output_dir}"),
+]
+
+# Data dependencies between gates. Gates run as soon as every prerequisite
+# has passed, so the tail checks (parallel-checks / smoke-test / ai-review)
+# overlap instead of running back to back.
+GATE_DEPS = {
+    "create-spec": set(),
+    "stress-test": {"create-spec"},
+    "validate": {"stress-test"},
+    "generate": {"validate"},
+    "check": {"generate"},
+    "generate-tests": {"check"},
+    "implement-tdd": {"generate-tests"},
+    "parallel-checks": {"implement-tdd"},
+    "smoke-test": {"implement-tdd"},
+    "ai-review": {"implement-tdd"},
+}
+
+# Same DAG keyed by integer gate_id; the scheduler works on id sets and
+# only touches names when printing.
+GATE_DEPS_IDS = {
+    GATES_BY_NAME[gate].gate_id: frozenset(
+        GATES_BY_NAME[dep].gate_id for dep in deps
+    )
+    for gate, deps in GATE_DEPS.items()
+}
+
+# Pipe drain: 64KB batched reads driven by a readiness loop, so a chatty
+# gate costs a handful of read() syscalls instead of one per output line.
+DRAIN_CHUNK_SIZE = 65536
+
+# ANSI palette (same scheme as design-ops-v3-refactored.sh). The colored
+# status lines are assembled once here as templates, so per-use cost is a
+# single format() call with no runtime color concatenation.
+GREEN = "\033[0;32m"
+YELLOW = "\033[1;33m"
+RED = "\033[0;31m"
+NC = "\033[0m"
+
+GATE_PASSED_TMPL = f"{GREEN}✅ Gate {{gate}} PASSED{NC}"
+GATE_FAILED_TMPL = f"{YELLOW}⚠️  Gate {{gate}} FAILED{NC}"
+GATE_GAVE_UP_TMPL = f"\n{RED}❌ Gate {{gate}} FAILED after {{max_iterations}} iterations{NC}"
+PIPELINE_FAILED_TMPL = f"\n{RED}❌ Pipeline failed at gate: {{gate}}{NC}"
+PIPELINE_PASSED_LINE = f"\n{GREEN}✅ Full pipeline completed successfully!{NC}"
+
+# Summary-worthy instruction lines: markdown headers and bullets. Compiled
+# once at module load and run over the mmapped buffer, so section detection
+# is one C-level scan instead of a Python loop over find() offsets.
+SUMMARY_LINE_RE = re.compile(rb"(?m)^[ \t]*(#[^\n]*|[-*] [^\n]*)")
+
+
+class PersistentBashRunner:
+    """Runs gate commands through a long-lived bash coprocess.
+
+    One bash is spawned per worker thread and kept alive across gates, with
+    a line-oriented request/response protocol: the gate command is written
+    to the coprocess stdin (stdin of the gate itself is /dev/null), followed
+    by sentinel printfs that report the exit code on stdout and mark the end
+    of stderr. Responses are drained with the same 64KB batched reads as
+    before. This amortizes the bash fork/exec and startup cost over the
+    whole pipeline instead of paying it once per gate iteration.
+    """
+
+    SENTINEL = b"\n__DESIGN_OPS_GATE_DONE__"
+
+    def __init__(self, workspace):
+        self.workspace = workspace
+        self._local = threading.local()
+
+    def _coprocess(self):
+        import subprocess
+
+        proc = getattr(self._local, "proc", None)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                ["bash", "--noprofile", "--norc"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self.workspace,
+            )
+            os.set_blocking(proc.stdout.fileno(), False)
+            os.set_blocking(proc.stderr.fileno(), False)
+            self._local.proc = proc
+        return proc
+
+    def run(self, args):
+        """Run argv in the coprocess. Returns (exit_code, stdout, stderr)."""
+        import shlex
+
+        proc = self._coprocess()
+        command = " ".join(shlex.quote(str(arg)) for arg in args)
+        request = (
+            command + " < /dev/null\n"
+            "printf '\\n%s %s\\n' __DESIGN_OPS_GATE_DONE__ $?\n"
+            "printf '\\n%s\\n' __DESIGN_OPS_GATE_DONE__ >&2\n"
+        )
+        proc.stdin.write(request.encode("utf-8"))
+        proc.stdin.flush()
+        return self._read_until_done(proc)
+
+    def _read_until_done(self, proc):
+        import selectors
+
+        sel = selectors.DefaultSelector()
+        buffers = {
+            proc.stdout.fileno(): bytearray(),
+            proc.stderr.fileno(): bytearray(),
+        }
+        sel.register(proc.stdout, selectors.EVENT_READ)
+        sel.register(proc.stderr, selectors.EVENT_READ)
+
+        done = {fd: False for fd in buffers}
+        while not all(done.values()):
+            events = sel.select(timeout=1.0)
+            if not events and proc.poll() is not None:
+                break  # coprocess died mid-gate
+            for key, _ in events:
+                fd = key.fileobj.fileno()
+                chunk = os.read(fd, DRAIN_CHUNK_SIZE)
+                if chunk:
+                    buffers[fd].extend(chunk)
+                    # The stream is only complete once the newline that
+                    # terminates the sentinel line has arrived: on stdout
+                    # the exit code follows the sentinel, and a read
+                    # boundary between them would drop the digits here and
+                    # leak them into the next request's output.
+                    marker = buffers[fd].find(self.SENTINEL)
+                    if marker != -1 and (
+                        buffers[fd].find(b"\n", marker + len(self.SENTINEL)) != -1
+                    ):
+                        done[fd] = True
+                else:
+                    done[fd] = True
+        sel.close()
+
+        stdout = bytes(buffers[proc.stdout.fileno()])
+        stderr = bytes(buffers[proc.stderr.fileno()])
+
+        exit_code = 1
+        marker = stdout.find(self.SENTINEL)
+        if marker != -1:
+            status_line = stdout[marker + len(self.SENTINEL):].split(b"\n", 1)[0]
+            try:
+                exit_code = int(status_line)
+            except ValueError:
+                pass
+            stdout = stdout[:marker]
+        marker = stderr.find(self.SENTINEL)
+        if marker != -1:
+            stderr = stderr[:marker]
+
+        return exit_code, stdout, stderr
+
+
+_script_probe = None
+
+
+def find_design_ops_script():
+    """Locate design-ops-v3-refactored.sh (installed copy first, then local).
+
+    The probe result is cached for the process: the script does not move
+    mid-run, so every invocation after the first skips the stat() calls.
+    Exits early when neither location has the script, so gate runners can
+    assume a ready script without re-probing.
+    """
+    global _script_probe
+    if _script_probe is not None:
+        return _script_probe
+
+    script = Path.home() / ".claude/design-ops/enforcement/design-ops-v3-refactored.sh"
+    if not script.exists():
+        script = SCRIPT_DIR / "design-ops-v3-refactored.sh"
+        if not script.exists():
+            print(f"❌ design-ops script not found: {script}")
+            sys.exit(1)
+    _script_probe = script
+    return script
+
+
+def instruction_path(gate, target):
+    """Instruction file convention: <target>.<gate>-instruction.md"""
+    base = str(target).split(":")[0]
+    return Path(f"{base}.{gate}-instruction.md")
+
+
+def read_instruction_file(path):
+    """Return instruction file contents as a read-only mmap, or None.
+
+    Mapping the file lets the summary scan walk the page cache in place
+    instead of materializing the whole file as a Python string and a list
+    of line copies.
+    """
+    import mmap
+
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+
+
+def print_instruction_summary(instruction):
+    """Print section headers and bullets so the user can triage quickly.
+
+    Runs the precompiled SUMMARY_LINE_RE over the mapped buffer — one
+    C-level scan, no per-line Python bookkeeping — and emits the summary
+    with one buffered write.
+    """
+    lines = [
+        b"  " + match.group(1).rstrip()
+        for match in SUMMARY_LINE_RE.finditer(instruction)
+    ]
+    if lines:
+        lines.append(b"")
+        sys.stdout.write(b"\n".join(lines).decode("utf-8", errors="replace"))
+
+
+class TaskOrchestrator:
+    """Runs design-ops gates and the full RALPH pipeline with fix loops."""
+
+    def __init__(self, workspace=None):
+        self.workspace = Path(workspace or os.getcwd()).resolve()
+        self.status_log = self.workspace / ".ralph" / "status.jsonl"
+        self._cleanup_legacy_markers()
+        # Serializes the interactive fix prompt when gates run concurrently:
+        # only one gate may own stdin at a time.
+        self._user_lock = threading.Lock()
+        # Gate results memoized on (gate, target content hash): re-validating
+        # an unchanged target is a no-op, so replay the recorded result.
+        self._gate_cache = {}
+        # Script path and argv prefix resolved once per orchestrator instead
+        # of per gate invocation (the loop re-runs gates many times).
+        self._script = find_design_ops_script()
+        self._command_prefix = [str(self._script)]
+        self._bash_runner = PersistentBashRunner(self.workspace)
+
+    def _cleanup_legacy_markers(self):
+        """Remove the pre-JSONL .ralph/status/ marker directory if present.
+
+        Uses os.scandir with plain string paths: one getdents batch per
+        directory read, no per-entry stat and no Path object churn, so a
+        marker directory left behind by hundreds of old runs clears cheaply.
+        """
+        marker_dir = os.path.join(str(self.workspace), ".ralph", "status")
+        try:
+            with os.scandir(marker_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            return
+        try:
+            os.rmdir(marker_dir)
+        except OSError:
+            pass  # something non-marker in there; leave it
+
+    def mark_gate_status(self, gate, status):
+        """Append a status record so external tools can track progress.
+
+        One append-only JSONL log (.ralph/status.jsonl) replaces the old
+        one-marker-file-per-status scheme: a status change is a single
+        O_APPEND write instead of a mkdir + glob + unlink + touch round
+        trip, and the log doubles as a run history. The latest record per
+        gate is the current status.
+        """
+        import json
+        import time
+
+        record = json.dumps(
+            {"gate": gate, "status": status, "ts": time.time()}
+        )
+        self.status_log.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.status_log, "a") as f:
+            f.write(record + "\n")
+
+    def _target_content_hash(self, target):
+        """sha256 over the target file(s), or None when the target is not
+        a plain file (directory targets change out-of-band, so never cache
+        those)."""
+        import hashlib
+
+        digest = hashlib.sha256()
+        for part in str(target).split(":"):
+            path = self.workspace / part
+            if not path.is_file():
+                return None
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def run_design_ops_gate(self, gate, target):
+        """Run one design-ops gate. Returns (passed, stdout_bytes, stderr_bytes).
+
+        Results are memoized on (gate, content hash of the target): gates are
+        deterministic functions of their input file, so re-validating an
+        unchanged target replays the recorded result without forking bash.
+        """
+        content_hash = self._target_content_hash(target)
+        if content_hash is not None:
+            cached = self._gate_cache.get((gate, content_hash))
+            if cached is not None:
+                return cached
+
+        result = self._run_design_ops_gate_uncached(gate, target)
+        if content_hash is not None:
+            self._gate_cache[(gate, content_hash)] = result
+        return result
+
+    def _run_design_ops_gate_uncached(self, gate, target):
+        # Two-argument gates (create-spec, implement) pack args as "first:second"
+        args = self._command_prefix + [gate] + str(target).split(":")
+        exit_code, stdout, stderr = self._bash_runner.run(args)
+        # The transcript stays as raw bytes; callers that never display it
+        # (the common PASS path, cache replays) skip decoding entirely.
+        # Any marker checks happen with a bytes-level `in` on this buffer —
+        # note the "✅" marker alone is not a pass verdict, since failing
+        # gates also print "✅ Instruction generated"; the exit code stays
+        # authoritative.
+        return exit_code == 0, stdout, stderr
+
+    def _target_mtime(self, target):
+        """Latest mtime across the target file(s), or None for non-files."""
+        latest = None
+        for part in str(target).split(":"):
+            try:
+                mtime = os.stat(os.path.join(str(self.workspace), part)).st_mtime
+            except OSError:
+                return None
+            latest = mtime if latest is None else max(latest, mtime)
+        return latest
+
+    def run_gate_with_loop(self, gate, target, max_iterations=DEFAULT_MAX_ITERATIONS):
+        """ASSESS -> (user fixes) -> RE-VALIDATE loop for one gate.
+
+        Re-validation is skipped (and the iteration not counted) when the
+        target's mtime is unchanged since the failed run: the gate is a
+        deterministic function of the target, so without an edit the
+        verdict cannot change and the user is simply prompted again.
+        """
+        print(f"🚀 Gate: {gate}")
+        print(f"   Target: {target}")
+        self.mark_gate_status(gate, "running")
+
+        last_failed_mtime = None
+        iteration = 0
+        while iteration < max_iterations:
+            current_mtime = self._target_mtime(target)
+            skipped = (
+                last_failed_mtime is not None
+                and current_mtime is not None
+                and current_mtime == last_failed_mtime
+            )
+            if skipped:
+                print("\n⏭️  Target unchanged since last failure — skipping re-validation")
+            else:
+                iteration += 1
+                print(f"\n🔄 Iteration {iteration}/{max_iterations}")
+                passed, stdout, stderr = self.run_design_ops_gate(gate, target)
+                last_failed_mtime = current_mtime
+
+                if passed:
+                    print(GATE_PASSED_TMPL.format(gate=gate))
+                    self.mark_gate_status(gate, "passed")
+                    return True
+
+                print(GATE_FAILED_TMPL.format(gate=gate))
+                if stderr.strip():
+                    print(stderr.decode("utf-8", errors="replace").strip())
+
+            with self._user_lock:
+                instruction_file = instruction_path(gate, target)
+                instruction = read_instruction_file(instruction_file)
+                if instruction:
+                    print(f"\n📋 Instruction Summary:")
+                    print_instruction_summary(instruction)
+
+                print("\nACTION REQUIRED:")
+                print(f"1. Review instruction file: {instruction_file}")
+                print("2. Use a Claude Code agent to follow the instruction and fix issues")
+                print("3. Press ENTER when done to re-validate (Ctrl-C to abort)")
+                try:
+                    input()
+                except (EOFError, KeyboardInterrupt):
+                    print("\n⏹️  Aborted by user")
+                    self.mark_gate_status(gate, "failed")
+                    return False
+
+        print(GATE_GAVE_UP_TMPL.format(gate=gate, max_iterations=max_iterations))
+        self.mark_gate_status(gate, "failed")
+        return False
+
+    def run_pipeline(self, req_dir, output_dir="."):
+        """Run all 10 gates on the dependency DAG, failing fast on any gate.
+
+        Gates are submitted as soon as every GATE_DEPS prerequisite has
+        passed, so independent tail gates overlap. Each gate writes its own
+        instruction-file artifact, so concurrent gates never share state.
+        A gate failure cancels everything not yet started.
+        """
+        import concurrent.futures
+
+        print("🏗️  Running full RALPH pipeline")
+        print(f"   Requirements: {req_dir}")
+        print(f"   Output: {output_dir}")
+        print("")
+
+        targets = {
+            "req_dir": req_dir,
+            "output_dir": output_dir,
+            "spec_file": f"{output_dir}/spec.md",
+            "prp_file": f"{output_dir}/spec-PRP.md",
+            "test_dir": f"{output_dir}/tests",
+        }
+        gate_targets = {
+            GATES_BY_NAME[gate].gate_id: template.format(**targets)
+            for gate, template in PIPELINE
+        }
+
+        pending = set(gate_targets)
+        completed = set()
+        futures = {}
+
+        # Threads (not processes): each gate is subprocess-bound, so workers
+        # spend their time waiting on child pipes, not holding the GIL.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            while pending or futures:
+                ready = [
+                    gate_id for gate_id in pending
+                    if GATE_DEPS_IDS[gate_id] <= completed
+                ]
+                for gate_id in ready:
+                    pending.discard(gate_id)
+                    gate = GATES[gate_id]
+                    futures[executor.submit(
+                        self.run_gate_with_loop,
+                        gate.name,
+                        gate_targets[gate_id],
+                        gate.max_iterations,
+                    )] = gate_id
+
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    gate_id = futures.pop(future)
+                    if not future.result():
+                        print(PIPELINE_FAILED_TMPL.format(gate=GATES[gate_id].name))
+                        for queued in futures:
+                            queued.cancel()
+                        return False
+                    completed.add(gate_id)
+
+        print(PIPELINE_PASSED_LINE)
+        print(f"   Spec: {targets['spec_file']}")
+        print(f"   PRP: {targets['prp_file']}")
+        print(f"   Tests: {targets['test_dir']}")
+        return True
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Claude Code orchestrator for the RALPH pipeline"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_gate = subparsers.add_parser("run-gate", help="Run a single gate with fix loop")
+    run_gate.add_argument("gate", choices=sorted(GATES_BY_NAME))
+    run_gate.add_argument("target", help="Target file (or first:second for 2-arg gates)")
+    run_gate.add_argument("--max-iterations", type=int, default=None)
+
+    run_pipeline = subparsers.add_parser("run-pipeline", help="Run the full pipeline")
+    run_pipeline.add_argument("req_dir", help="Requirements directory")
+    run_pipeline.add_argument("output_dir", nargs="?", default=".")
+
+    validate_spec = subparsers.add_parser("validate-spec", help="Validate spec once (no loop)")
+    validate_spec.add_argument("spec_file")
+
+    args = parser.parse_args()
+    orchestrator = TaskOrchestrator()
+
+    if args.command == "run-gate":
+        max_iterations = args.max_iterations or GATES_BY_NAME[args.gate].max_iterations
+        ok = orchestrator.run_gate_with_loop(args.gate, args.target, max_iterations)
+    elif args.command == "run-pipeline":
+        ok = orchestrator.run_pipeline(args.req_dir, args.output_dir)
+    else:  # validate-spec
+        passed, stdout, stderr = orchestrator.run_design_ops_gate(
+            "validate", args.spec_file
+        )
+        sys.stdout.write(stdout.decode("utf-8", errors="replace"))
+        if stderr.strip():
+            print(stderr.decode("utf-8", errors="replace").strip(), file=sys.stderr)
+        ok = passed
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
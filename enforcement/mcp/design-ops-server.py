@@ -1,278 +1,397 @@
-#!/usr/bin/env python3
-"""
-Design-Ops MCP Server
-
-Exposes design-ops validation rules and project patterns via Model Context Protocol.
-
-Usage:
-    # In Claude Code MCP settings:
-    {
-      "mcpServers": {
-        "design-ops": {
-          "command": "python",
-          "args": ["/path/to/design-ops-server.py"]
-        }
-      }
-    }
-
-Tools provided:
-- get_invariants: Get all 43 invariants
-- get_security_rules: Get security validation rules
-- get_project_conventions: Get CONVENTIONS.md if exists
-- validate_spec_snippet: Validate a snippet against rules
-"""
-
-import json
-import sys
-from pathlib import Path
-
-# MCP Protocol
-def send_message(msg):
-    """Send MCP message to stdout"""
-    print(json.dumps(msg), flush=True)
-
-def receive_message():
-    """Receive MCP message from stdin"""
-    line = sys.stdin.readline()
-    if not line:
-        return None
-    return json.loads(line)
-
-def get_invariants():
-    """Return all 43 system invariants"""
-    # Read from system-invariants.md
-    design_ops_base = Path.home() / ".claude/design-ops"
-    invariants_file = design_ops_base / "system-invariants.md"
-
-    if invariants_file.exists():
-        content = invariants_file.read_text()
-        # Parse invariants (simplified - real implementation would parse markdown)
-        return {
-            "count": 43,
-            "source": str(invariants_file),
-            "content": content[:5000]  # Truncate for MCP response size
-        }
-    else:
-        return {"error": "system-invariants.md not found"}
-
-def get_security_rules():
-    """Return security validation rules"""
-    return {
-        "rules": [
-            {
-                "id": "SEC-001",
-                "name": "Authentication Required",
-                "check": "Spec must mention authentication method (JWT, OAuth, session-based)"
-            },
-            {
-                "id": "SEC-002",
-                "name": "Authorization Documented",
-                "check": "Spec must define permission model and access control rules"
-            },
-            {
-                "id": "SEC-003",
-                "name": "PII Handling",
-                "check": "If handling personal data, must specify encryption, retention, GDPR compliance"
-            },
-            {
-                "id": "SEC-004",
-                "name": "Rate Limiting",
-                "check": "API endpoints must define rate limits"
-            },
-            {
-                "id": "SEC-005",
-                "name": "Input Validation",
-                "check": "Must specify validation rules for all user inputs"
-            },
-            {
-                "id": "SEC-006",
-                "name": "Error Handling",
-                "check": "Error messages must not leak sensitive information"
-            },
-            {
-                "id": "SEC-007",
-                "name": "SQL Injection Prevention",
-                "check": "Must use parameterized queries"
-            },
-            {
-                "id": "SEC-008",
-                "name": "XSS Prevention",
-                "check": "Must sanitize all inputs"
-            },
-            {
-                "id": "SEC-009",
-                "name": "CSRF Protection",
-                "check": "Must use CSRF tokens"
-            }
-        ]
-    }
-
-def get_project_conventions(project_dir="."):
-    """Return CONVENTIONS.md if exists in project"""
-    conventions_file = Path(project_dir) / "CONVENTIONS.md"
-
-    if conventions_file.exists():
-        return {
-            "found": True,
-            "path": str(conventions_file),
-            "content": conventions_file.read_text()[:5000]
-        }
-    else:
-        return {
-            "found": False,
-            "message": "No CONVENTIONS.md found in project"
-        }
-
-def validate_spec_snippet(snippet):
-    """Quick validation of a spec snippet against common issues"""
-    issues = []
-
-    # Check for vague words
-    vague_words = ["properly", "correctly", "appropriately", "easily", "simply", "just", "obviously"]
-    for word in vague_words:
-        if word in snippet.lower():
-            issues.append({
-                "severity": "warning",
-                "rule": "Invariant #1: Ambiguity is Invalid",
-                "message": f"Vague word '{word}' found - replace with objective criteria"
-            })
-
-    # Check for missing error states
-    if "error" not in snippet.lower() and "fail" not in snippet.lower():
-        issues.append({
-            "severity": "warning",
-            "rule": "Common Issue: Missing Error States",
-            "message": "Consider documenting error handling"
-        })
-
-    # Check for missing acceptance criteria
-    if "acceptance" not in snippet.lower() and "success" not in snippet.lower():
-        issues.append({
-            "severity": "info",
-            "rule": "Best Practice: Acceptance Criteria",
-            "message": "Consider adding clear acceptance criteria"
-        })
-
-    return {
-        "valid": len(issues) == 0,
-        "issues": issues,
-        "checked_rules": ["ambiguity", "error_states", "acceptance_criteria"]
-    }
-
-# MCP Server Loop
-def main():
-    # Send server info
-    send_message({
-        "jsonrpc": "2.0",
-        "method": "initialized",
-        "params": {
-            "serverInfo": {
-                "name": "design-ops",
-                "version": "1.0.0"
-            },
-            "capabilities": {
-                "tools": {
-                    "listChanged": False
-                }
-            }
-        }
-    })
-
-    # Main loop
-    while True:
-        msg = receive_message()
-        if not msg:
-            break
-
-        method = msg.get("method")
-        id = msg.get("id")
-        params = msg.get("params", {})
-
-        if method == "tools/list":
-            # List available tools
-            send_message({
-                "jsonrpc": "2.0",
-                "id": id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "get_invariants",
-                            "description": "Get all 43 design-ops system invariants",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "get_security_rules",
-                            "description": "Get security validation rules (9 rules)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "get_project_conventions",
-                            "description": "Get project-specific conventions from CONVENTIONS.md",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "project_dir": {
-                                        "type": "string",
-                                        "description": "Project directory path (default: current)"
-                                    }
-                                }
-                            }
-                        },
-                        {
-                            "name": "validate_spec_snippet",
-                            "description": "Quick validation of spec text against common issues",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "snippet": {
-                                        "type": "string",
-                                        "description": "Spec text to validate"
-                                    }
-                                },
-                                "required": ["snippet"]
-                            }
-                        }
-                    ]
-                }
-            })
-
-        elif method == "tools/call":
-            # Execute tool
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
-
-            result = None
-            if tool_name == "get_invariants":
-                result = get_invariants()
-            elif tool_name == "get_security_rules":
-                result = get_security_rules()
-            elif tool_name == "get_project_conventions":
-                project_dir = arguments.get("project_dir", ".")
-                result = get_project_conventions(project_dir)
-            elif tool_name == "validate_spec_snippet":
-                snippet = arguments.get("snippet", "")
-                result = validate_spec_snippet(snippet)
-            else:
-                result = {"error": f"Unknown tool: {tool_name}"}
-
-            send_message({
-                "jsonrpc": "2.0",
-                "id": id,
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": json.dumps(result, indent=2)
-                        }
-                    ]
-                }
-            })
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Design-Ops MCP Server
+
+Exposes design-ops validation rules and project patterns via Model Context Protocol.
+
+Usage:
+    # In Claude Code MCP settings:
+    {
+      "mcpServers": {
+        "design-ops": {
+          "command": "python",
+          "args": ["/path/to/design-ops-server.py"]
+        }
+      }
+    }
+
+Tools provided:
+- get_invariants: Get all 43 invariants
+- get_security_rules: Get security validation rules
+- get_project_conventions: Get CONVENTIONS.md if exists
+- validate_spec_snippet: Validate a snippet against rules
+"""
+
+import functools
+import json
+import mmap
+import os
+import re
+import selectors
+import sys
+from pathlib import Path
+
+# Serialization: orjson (C implementation) when installed, stdlib json
+# otherwise. The server stays dependency-free — orjson is opportunistic.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+# Snippet validation vocabulary. The snippet is tokenized once and each
+# check is a set intersection, so all three rules share a single scan.
+VAGUE_WORDS = ("properly", "correctly", "appropriately", "easily", "simply", "just", "obviously")
+_VAGUE = frozenset(VAGUE_WORDS)
+# Inflections listed explicitly: token matching is exact-word, unlike the
+# old substring checks that also caught "fails"/"successful" etc.
+_ERROR_WORDS = frozenset({"error", "errors", "fail", "fails", "failed", "failing", "failure", "failures"})
+_ACCEPTANCE_WORDS = frozenset({"acceptance", "success", "successes", "successful", "successfully"})
+_WORD_RE = re.compile(r"[a-z]+")
+
+# MCP Protocol
+def send_message(msg):
+    """Send MCP message to stdout (one buffered write + flush)"""
+    sys.stdout.buffer.write(_dumps(msg) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_invariants(path, mtime_ns, size):
+    """Read and truncate system-invariants.md, cached per (mtime, size).
+
+    The file is static within a server lifetime, so repeat tools/call
+    requests hit the cache; an edit changes the stat key and evicts it.
+    Only the first 5000 bytes are mapped and decoded — the tail of a
+    large file never gets materialized as a Python string.
+    """
+    if size == 0:
+        content = ""
+    else:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = mm[:5000].decode("utf-8", errors="replace")
+    # Parse invariants (simplified - real implementation would parse markdown)
+    return {
+        "count": 43,
+        "source": path,
+        "content": content  # Truncated for MCP response size
+    }
+
+
+# Resolved once at import: Path.home() goes through expanduser and builds
+# several intermediate PurePath objects — no reason to pay that per call.
+_DESIGN_OPS_BASE = Path.home() / ".claude/design-ops"
+_INVARIANTS_FILE = _DESIGN_OPS_BASE / "system-invariants.md"
+_INVARIANTS_PATH = str(_INVARIANTS_FILE)
+
+
+def get_invariants():
+    """Return all 43 system invariants"""
+    # Read from system-invariants.md
+    try:
+        st = os.stat(_INVARIANTS_PATH)
+    except OSError:
+        return {"error": "system-invariants.md not found"}
+    return _read_invariants(_INVARIANTS_PATH, st.st_mtime_ns, st.st_size)
+
+# Security rules are fully static: frozen as a module constant, with the
+# indented JSON text precomputed so the tools/call fast path can skip
+# re-serializing them on every request.
+_SECURITY_RULES = {
+    "rules": (
+        {
+            "id": "SEC-001",
+            "name": "Authentication Required",
+            "check": "Spec must mention authentication method (JWT, OAuth, session-based)"
+        },
+        {
+            "id": "SEC-002",
+            "name": "Authorization Documented",
+            "check": "Spec must define permission model and access control rules"
+        },
+        {
+            "id": "SEC-003",
+            "name": "PII Handling",
+            "check": "If handling personal data, must specify encryption, retention, GDPR compliance"
+        },
+        {
+            "id": "SEC-004",
+            "name": "Rate Limiting",
+            "check": "API endpoints must define rate limits"
+        },
+        {
+            "id": "SEC-005",
+            "name": "Input Validation",
+            "check": "Must specify validation rules for all user inputs"
+        },
+        {
+            "id": "SEC-006",
+            "name": "Error Handling",
+            "check": "Error messages must not leak sensitive information"
+        },
+        {
+            "id": "SEC-007",
+            "name": "SQL Injection Prevention",
+            "check": "Must use parameterized queries"
+        },
+        {
+            "id": "SEC-008",
+            "name": "XSS Prevention",
+            "check": "Must sanitize all inputs"
+        },
+        {
+            "id": "SEC-009",
+            "name": "CSRF Protection",
+            "check": "Must use CSRF tokens"
+        },
+    )
+}
+_SECURITY_RULES_TEXT = _dumps_indented(_SECURITY_RULES).decode("utf-8")
+# Same text pre-escaped as a JSON string value, for splicing straight
+# into a response envelope without re-serializing.
+_SECURITY_RULES_PAYLOAD = _dumps(_SECURITY_RULES_TEXT)
+
+def get_security_rules():
+    """Return security validation rules"""
+    return _SECURITY_RULES
+
+def get_project_conventions(project_dir="."):
+    """Return CONVENTIONS.md if exists in project"""
+    conventions_file = Path(project_dir) / "CONVENTIONS.md"
+
+    # Single open; a missing file surfaces as the error instead of a
+    # separate exists() stat beforehand.
+    try:
+        content = conventions_file.read_bytes()
+    except OSError:
+        return {
+            "found": False,
+            "message": "No CONVENTIONS.md found in project"
+        }
+    return {
+        "found": True,
+        "path": str(conventions_file),
+        "content": content[:5000].decode("utf-8", errors="replace")
+    }
+
+_EMPTY_SNIPPET_RESULT = {
+    "valid": True,
+    "issues": [],
+    "checked_rules": ["ambiguity", "error_states", "acceptance_criteria"]
+}
+
+
+def validate_spec_snippet(snippet):
+    """Quick validation of a spec snippet against common issues"""
+    # Empty/whitespace snippets (e.g. a defaulted argument) skip the scan.
+    if not snippet or snippet.isspace():
+        return _EMPTY_SNIPPET_RESULT
+    return _validate_spec_snippet_cached(snippet)
+
+
+@functools.lru_cache(maxsize=512)
+def _validate_spec_snippet_cached(snippet):
+    """Memoized per snippet: iterating clients re-validate the same text
+    repeatedly, and results are shared (never mutated) so a hit is O(1)."""
+    issues = []
+
+    # Tokenize once; every rule below is a set intersection on the result.
+    tokens = frozenset(_WORD_RE.findall(snippet.lower()))
+
+    # Check for vague words (iterate the tuple so issue order is stable)
+    vague_hits = tokens & _VAGUE
+    for word in VAGUE_WORDS:
+        if word not in vague_hits:
+            continue
+        issues.append({
+            "severity": "warning",
+            "rule": "Invariant #1: Ambiguity is Invalid",
+            "message": f"Vague word '{word}' found - replace with objective criteria"
+        })
+
+    # Check for missing error states
+    if not (tokens & _ERROR_WORDS):
+        issues.append({
+            "severity": "warning",
+            "rule": "Common Issue: Missing Error States",
+            "message": "Consider documenting error handling"
+        })
+
+    # Check for missing acceptance criteria
+    if not (tokens & _ACCEPTANCE_WORDS):
+        issues.append({
+            "severity": "info",
+            "rule": "Best Practice: Acceptance Criteria",
+            "message": "Consider adding clear acceptance criteria"
+        })
+
+    return {
+        "valid": len(issues) == 0,
+        "issues": issues,
+        "checked_rules": ["ambiguity", "error_states", "acceptance_criteria"]
+    }
+
+# Tool dispatch table: O(1) name lookup instead of an if/elif cascade.
+# Each handler takes the raw arguments dict and pulls its own defaults.
+_TOOL_HANDLERS = {
+    "get_invariants": lambda arguments: get_invariants(),
+    "get_security_rules": lambda arguments: get_security_rules(),
+    "get_project_conventions": lambda arguments: get_project_conventions(arguments.get("project_dir", ".")),
+    "validate_spec_snippet": lambda arguments: validate_spec_snippet(arguments.get("snippet", "")),
+}
+
+# tools/list payload is fully static: built once at import and shared by
+# every response (never mutated), so each list call only allocates the
+# outer envelope.
+_TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "get_invariants",
+            "description": "Get all 43 design-ops system invariants",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "get_security_rules",
+            "description": "Get security validation rules (9 rules)",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "get_project_conventions",
+            "description": "Get project-specific conventions from CONVENTIONS.md",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "project_dir": {
+                        "type": "string",
+                        "description": "Project directory path (default: current)"
+                    }
+                }
+            }
+        },
+        {
+            "name": "validate_spec_snippet",
+            "description": "Quick validation of spec text against common issues",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "snippet": {
+                        "type": "string",
+                        "description": "Spec text to validate"
+                    }
+                },
+                "required": ["snippet"]
+            }
+        }
+    ]
+}
+
+
+# MCP Server Loop
+def main():
+    # Send server info
+    send_message({
+        "jsonrpc": "2.0",
+        "method": "initialized",
+        "params": {
+            "serverInfo": {
+                "name": "design-ops",
+                "version": "1.0.0"
+            },
+            "capabilities": {
+                "tools": {
+                    "listChanged": False
+                }
+            }
+        }
+    })
+
+    # Main loop: multiplex stdin through a selector. Readiness-driven
+    # reads keep the batched-drain behaviour (one read1 per wakeup, frames
+    # split at newlines) and leave room to register timers or other fds
+    # later — e.g. TTL-based cache refresh while stdin is idle.
+    sel = selectors.DefaultSelector()
+    sel.register(sys.stdin, selectors.EVENT_READ)
+    stdin = sys.stdin.buffer
+    buf = bytearray()
+    at_eof = False
+    while not at_eof:
+        for key, _ in sel.select():
+            chunk = stdin.read1(8192)
+            if not chunk:
+                at_eof = True
+                break
+            buf.extend(chunk)
+            start = 0
+            while True:
+                newline = buf.find(b"\n", start)
+                if newline == -1:
+                    break
+                line = bytes(buf[start:newline])
+                start = newline + 1
+                if line.strip():
+                    handle_message(_loads(line))
+            if start:
+                del buf[:start]
+    sel.close()
+
+def handle_message(msg):
+    """Dispatch one decoded JSON-RPC message."""
+    method = msg.get("method")
+    id = msg.get("id")
+    params = msg.get("params", {})
+
+    if method == "tools/list":
+        # List available tools (shared static payload, fresh envelope)
+        send_message({
+            "jsonrpc": "2.0",
+            "id": id,
+            "result": _TOOLS_LIST_RESULT
+        })
+
+    elif method == "tools/call":
+        # Execute tool
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+
+        if tool_name == "get_security_rules":
+            # Static payload: reuse the pre-escaped response text
+            payload = _SECURITY_RULES_PAYLOAD
+        else:
+            handler = _TOOL_HANDLERS.get(tool_name)
+            if handler is not None:
+                result = handler(arguments)
+            else:
+                result = {"error": f"Unknown tool: {tool_name}"}
+            payload = _dumps(_dumps_indented(result).decode("utf-8"))
+
+        # The envelope framing is constant, so splice the serialized id
+        # and payload between byte fragments instead of re-walking (and
+        # re-escaping) a full envelope dict for every response.
+        sys.stdout.buffer.write(
+            b'{"jsonrpc":"2.0","id":%s,"result":{"content":[{"type":"text","text":%s}]}}\n'
+            % (_dumps(id), payload)
+        )
+        sys.stdout.buffer.flush()
+
+if __name__ == "__main__":
+    main()
@@ -11,34 +11,57 @@ Usage:
 
 import sys
 import os
+import asyncio
+import collections
+import functools
+import hashlib
+import re
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 
-def generate_tasks(spec_file):
-    """Generate all 12 RALPH gates as task definitions with MANDATORY git commits."""
-
-    spec_path = Path(spec_file).resolve()
-    if not spec_path.exists():
-        print(f"❌ Spec file not found: {spec_file}")
-        sys.exit(1)
-
-    # Derive paths
-    spec_name = spec_path.stem
-    spec_dir = spec_path.parent
-    prp_file = spec_dir.parent / "PRPs" / f"{spec_name}-prp.md"
-    code_dir = spec_dir.parent / "src"
-    test_dir = spec_dir.parent / "tests"
-
-    design_ops_script = Path.home() / ".claude/design-ops/enforcement/design-ops-v3-refactored.sh"
-
-    tasks = [
-        # GATE 1: STRESS_TEST
-        {
-            "id": "ralph-1",
-            "subject": "GATE 1: STRESS_TEST - Check spec completeness",
-            "description": f"""## GATE 1: STRESS_TEST
-
-## 🚨 READ FIRST: Gate Constraints
+# Serialization: orjson (C implementation) when installed, stdlib json
+# otherwise. The orchestrator stays dependency-free — orjson is
+# opportunistic, same as the MCP server and the v3 orchestrator.
+try:
+    import orjson
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# msgpack is equally opportunistic: when installed, a binary sidecar of
+# the task graph is written next to tasks.json so the loader can skip
+# re-parsing ~50KB of indented JSON on every run.
+try:
+    import msgpack
+
+    _packb = msgpack.packb
+except ImportError:
+    _packb = None
+
+# Resolved once at import: Path.home() hits pwd.getpwuid and builds a
+# chain of intermediate PurePath objects. DESIGN_OPS_ROOT overrides the
+# default install location without editing source.
+_DESIGN_OPS_ROOT = Path(os.environ.get("DESIGN_OPS_ROOT") or Path.home() / ".claude/design-ops")
+_DESIGN_OPS_SCRIPT = _DESIGN_OPS_ROOT / "enforcement/design-ops-v3-refactored.sh"
+_DESIGN_OPS_SCRIPT_STR = str(_DESIGN_OPS_SCRIPT)
+
+# Matches the commit subjects the gate VERIFY steps check for
+# ("ralph: GATE <n> - <summary>"). The optional letter suffix covers the
+# parallel sub-agent subjects mandated by the v3 templates, e.g.
+# "ralph: GATE 2A - ..." and "ralph: GATE 6.5C - ...". Compiled once at
+# import so downstream consumers of tasks.json (task loader, CI checks)
+# can import and reuse it on git log lines instead of re-parsing with
+# startswith/split; `--verify-commit` below exposes it on the CLI.
+VERIFY_COMMIT_RE = re.compile(r"^ralph: GATE (\d+(?:\.\d+)?[A-Z]?)\s*-\s*(.+)$")
+
+# Shared verbatim by every gate description; one literal in source (and
+# one string object at runtime) instead of twelve copies.
+_HEADER = """## 🚨 READ FIRST: Gate Constraints
 
 **BEFORE YOU START:**
 1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
@@ -57,7 +80,25 @@ def generate_tasks(spec_file):
 **If validation says "fix X"** → Fix X only. Not X + Y + Z.
 
 ---
+"""
 
+# On disk the header is stored once in a "shared" map and each task
+# description carries this marker line instead of its own ~1.2KB copy;
+# the loader splices the text back in. In-process APIs (generate_tasks,
+# iter_tasks) still hand out fully assembled descriptions.
+_HEADER_MARKER = "{{gate_header}}\n"
+
+_TELEMETRY_FOOTER = """**Telemetry:**
+Write to `.ralph/metrics/gate-{n}.json` on completion.
+"""
+
+# Gate descriptions, hoisted to module scope: the markdown is parsed
+# once at import and generate_tasks only interpolates the paths via
+# format_map instead of rebuilding 12 multi-KB f-strings per call.
+_GATE_DESCRIPTIONS = {
+    "ralph-1": """## GATE 1: STRESS_TEST
+
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed spec file: {spec_path}
 - Errors from last stress-test run
@@ -114,40 +155,10 @@ git log -1 --oneline
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-1.json` on completion.
-""",
-            "activeForm": "Running GATE 1: STRESS_TEST",
-            "blocks": ["ralph-2"],
-            "blockedBy": []
-        },
-
-        # GATE 2: VALIDATE + SECURITY_SCAN
-        {
-            "id": "ralph-2",
-            "subject": "GATE 2: VALIDATE + SECURITY_SCAN - Check clarity and security",
-            "description": f"""## GATE 2: VALIDATE + SECURITY_SCAN
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="1") + """""",
+    "ralph-2": """## GATE 2: VALIDATE + SECURITY_SCAN
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed spec file: {spec_path}
 - Errors from last validate run
@@ -208,40 +219,10 @@ git log -1 --oneline
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-2.json` on completion.
-""",
-            "activeForm": "Running GATE 2: VALIDATE + SECURITY_SCAN",
-            "blocks": ["ralph-3"],
-            "blockedBy": ["ralph-1"]
-        },
-
-        # GATE 3: GENERATE_PRP
-        {
-            "id": "ralph-3",
-            "subject": "GATE 3: GENERATE_PRP - Extract Product Requirements Prompt",
-            "description": f"""## GATE 3: GENERATE_PRP
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="2") + """""",
+    "ralph-3": """## GATE 3: GENERATE_PRP
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed spec file: {spec_path}
 - NO full conversation history
@@ -299,40 +280,10 @@ If still failing, go back to step 3a.
 **Output:**
 PRP file created at: {prp_file}
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-3.json` on completion.
-""",
-            "activeForm": "Running GATE 3: GENERATE_PRP",
-            "blocks": ["ralph-4"],
-            "blockedBy": ["ralph-2"]
-        },
-
-        # GATE 4: CHECK_PRP
-        {
-            "id": "ralph-4",
-            "subject": "GATE 4: CHECK_PRP - Validate PRP structure",
-            "description": f"""## GATE 4: CHECK_PRP
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="3") + """""",
+    "ralph-4": """## GATE 4: CHECK_PRP
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed PRP file: {prp_file}
 - NO full conversation history
@@ -391,40 +342,10 @@ git log -1 --oneline
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-4.json` on completion.
-""",
-            "activeForm": "Running GATE 4: CHECK_PRP",
-            "blocks": ["ralph-5"],
-            "blockedBy": ["ralph-3"]
-        },
-
-        # GATE 5: GENERATE_TESTS
-        {
-            "id": "ralph-5",
-            "subject": "GATE 5: GENERATE_TESTS - Create test suite",
-            "description": f"""## GATE 5: GENERATE_TESTS
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="4") + """""",
+    "ralph-5": """## GATE 5: GENERATE_TESTS
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed PRP file: {prp_file}
 - NO full conversation history
@@ -487,40 +408,10 @@ If still failing, go back to step 3a.
 **Output:**
 Test files in: {test_dir}/
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-5.json` on completion.
-""",
-            "activeForm": "Running GATE 5: GENERATE_TESTS",
-            "blocks": ["ralph-5.5"],
-            "blockedBy": ["ralph-4"]
-        },
-
-        # GATE 5.5: TEST_VALIDATION + TEST_QUALITY
-        {
-            "id": "ralph-5.5",
-            "subject": "GATE 5.5: TEST_VALIDATION + TEST_QUALITY - Validate test suite",
-            "description": f"""## GATE 5.5: TEST_VALIDATION + TEST_QUALITY
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="5") + """""",
+    "ralph-5.5": """## GATE 5.5: TEST_VALIDATION + TEST_QUALITY
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed test files: {test_dir}/
 - NO full conversation history
@@ -584,54 +475,24 @@ git log -1 --oneline
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-5.5.json` on completion.
-""",
-            "activeForm": "Running GATE 5.5: TEST_VALIDATION + TEST_QUALITY",
-            "blocks": ["ralph-5.75"],
-            "blockedBy": ["ralph-5"]
-        },
-
-        # GATE 5.75: PREFLIGHT
-        {
-            "id": "ralph-5.75",
-            "subject": "GATE 5.75: PREFLIGHT - Environment checks",
-            "description": f"""## GATE 5.75: PREFLIGHT
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="5.5") + """""",
+    "ralph-5.75": """## GATE 5.75: PREFLIGHT
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed project files
 - NO full conversation history
 
 ### Command:
 ```bash
-{design_ops_script} preflight {code_dir.parent}
+{design_ops_script} preflight {project_root}
 ```
 
 ### MANDATORY Loop (DO NOT SKIP ANY STEP):
 
 **1. ASSESS:**
 ```bash
-{design_ops_script} preflight {code_dir.parent}
+{design_ops_script} preflight {project_root}
 ```
 
 Check:
@@ -648,7 +509,7 @@ Check:
 
 **3a. READ INSTRUCTION:**
 ```bash
-cat {code_dir.parent}/preflight-instruction.md
+cat {project_root}/preflight-instruction.md
 ```
 
 **3b. FIX:**
@@ -671,46 +532,16 @@ git log -1 --oneline
 
 **3e. RE-VALIDATE:**
 ```bash
-{design_ops_script} preflight {code_dir.parent}
+{design_ops_script} preflight {project_root}
 ```
 
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-5.75.json` on completion.
-""",
-            "activeForm": "Running GATE 5.75: PREFLIGHT",
-            "blocks": ["ralph-6"],
-            "blockedBy": ["ralph-5.5"]
-        },
-
-        # GATE 6: IMPLEMENT_TDD
-        {
-            "id": "ralph-6",
-            "subject": "GATE 6: IMPLEMENT_TDD - Write code to pass tests",
-            "description": f"""## GATE 6: IMPLEMENT_TDD
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="5.75") + """""",
+    "ralph-6": """## GATE 6: IMPLEMENT_TDD
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed test files: {test_dir}/
 - Latest committed source files: {code_dir}/
@@ -739,7 +570,7 @@ git commit -m "ralph: GATE 6 - pass test: [test_name]"
 
 **1. ASSESS:**
 ```bash
-cd {code_dir.parent} && pytest {test_dir}/
+cd {project_root} && pytest {test_dir}/
 ```
 
 **2. IF ALL TESTS PASS:**
@@ -772,47 +603,17 @@ If more tests failing, go back to step 3a.
 - 🚨 MINIMAL code only
 - 🚨 NO speculative features
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-6.json` on completion.
-""",
-            "activeForm": "Running GATE 6: IMPLEMENT_TDD",
-            "blocks": ["ralph-6.5"],
-            "blockedBy": ["ralph-5.75"]
-        },
-
-        # GATE 6.5: PARALLEL_CHECKS
-        {
-            "id": "ralph-6.5",
-            "subject": "GATE 6.5: PARALLEL_CHECKS - Build/Lint/Integration/A11y",
-            "description": f"""## GATE 6.5: PARALLEL_CHECKS
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="6") + """""",
+    "ralph-6.5": """## GATE 6.5: PARALLEL_CHECKS
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed source files: {code_dir}/
 - NO full conversation history
 
 ### Command:
 ```bash
-{design_ops_script} parallel-checks {code_dir.parent}
+{design_ops_script} parallel-checks {project_root}
 ```
 
 Runs in parallel:
@@ -825,7 +626,7 @@ Runs in parallel:
 
 **1. ASSESS:**
 ```bash
-{design_ops_script} parallel-checks {code_dir.parent}
+{design_ops_script} parallel-checks {project_root}
 ```
 
 **2. IF ALL PASS:**
@@ -836,7 +637,7 @@ Runs in parallel:
 
 **3a. READ INSTRUCTION:**
 ```bash
-cat {code_dir.parent}/parallel-checks-instruction.md
+cat {project_root}/parallel-checks-instruction.md
 ```
 
 **3b. FIX:**
@@ -859,46 +660,16 @@ git log -1 --oneline
 
 **3e. RE-VALIDATE:**
 ```bash
-{design_ops_script} parallel-checks {code_dir.parent}
+{design_ops_script} parallel-checks {project_root}
 ```
 
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-6.5.json` on completion.
-""",
-            "activeForm": "Running GATE 6.5: PARALLEL_CHECKS",
-            "blocks": ["ralph-6.9"],
-            "blockedBy": ["ralph-6"]
-        },
-
-        # GATE 6.9: VISUAL_REGRESSION
-        {
-            "id": "ralph-6.9",
-            "subject": "GATE 6.9: VISUAL_REGRESSION - Screenshot testing",
-            "description": f"""## GATE 6.9: VISUAL_REGRESSION
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="6.5") + """""",
+    "ralph-6.9": """## GATE 6.9: VISUAL_REGRESSION
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed source files: {code_dir}/
 - Baseline screenshots
@@ -906,14 +677,14 @@ Write to `.ralph/metrics/gate-6.5.json` on completion.
 
 ### Command:
 ```bash
-{design_ops_script} visual-regression {code_dir.parent}
+{design_ops_script} visual-regression {project_root}
 ```
 
 ### MANDATORY Loop (DO NOT SKIP ANY STEP):
 
 **1. ASSESS:**
 ```bash
-{design_ops_script} visual-regression {code_dir.parent}
+{design_ops_script} visual-regression {project_root}
 ```
 
 **2. IF PASS:**
@@ -924,7 +695,7 @@ Write to `.ralph/metrics/gate-6.5.json` on completion.
 
 **3a. READ DIFF REPORT:**
 ```bash
-open {code_dir.parent}/.ralph/visual-regression-report.html
+open {project_root}/.ralph/visual-regression-report.html
 ```
 
 **3b. DETERMINE:**
@@ -935,7 +706,7 @@ open {code_dir.parent}/.ralph/visual-regression-report.html
 If regression: Fix code
 If intended: Approve baseline:
 ```bash
-{design_ops_script} visual-regression-approve {code_dir.parent}
+{design_ops_script} visual-regression-approve {project_root}
 ```
 
 **3d. 🚨 MANDATORY GIT COMMIT (DO NOT SKIP):**
@@ -955,46 +726,16 @@ git log -1 --oneline
 
 **3f. RE-VALIDATE:**
 ```bash
-{design_ops_script} visual-regression {code_dir.parent}
+{design_ops_script} visual-regression {project_root}
 ```
 
 **3g. LOOP:**
 If still failing, go back to step 3a.
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-6.9.json` on completion.
-""",
-            "activeForm": "Running GATE 6.9: VISUAL_REGRESSION",
-            "blocks": ["ralph-7"],
-            "blockedBy": ["ralph-6.5"]
-        },
-
-        # GATE 7: SMOKE_TEST
-        {
-            "id": "ralph-7",
-            "subject": "GATE 7: SMOKE_TEST - E2E critical paths",
-            "description": f"""## GATE 7: SMOKE_TEST
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="6.9") + """""",
+    "ralph-7": """## GATE 7: SMOKE_TEST
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed source files: {code_dir}/
 - Latest committed E2E tests
@@ -1002,14 +743,14 @@ Write to `.ralph/metrics/gate-6.9.json` on completion.
 
 ### Command:
 ```bash
-{design_ops_script} smoke-test {code_dir.parent}
+{design_ops_script} smoke-test {project_root}
 ```
 
 ### MANDATORY Loop (DO NOT SKIP ANY STEP):
 
 **1. ASSESS:**
 ```bash
-{design_ops_script} smoke-test {code_dir.parent}
+{design_ops_script} smoke-test {project_root}
 ```
 
 **2. IF ALL PASS:**
@@ -1020,7 +761,7 @@ Write to `.ralph/metrics/gate-6.9.json` on completion.
 
 **3a. READ REPORT:**
 ```bash
-cat {code_dir.parent}/.ralph/smoke-test-report.html
+cat {project_root}/.ralph/smoke-test-report.html
 ```
 
 **3b. FIX:**
@@ -1043,7 +784,7 @@ git log -1 --oneline
 
 **3e. RE-VALIDATE:**
 ```bash
-{design_ops_script} smoke-test {code_dir.parent}
+{design_ops_script} smoke-test {project_root}
 ```
 
 **3f. LOOP:**
@@ -1055,56 +796,26 @@ If still failing, go back to step 3a.
 - Data CRUD operations
 - Error handling
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-7.json` on completion.
-""",
-            "activeForm": "Running GATE 7: SMOKE_TEST",
-            "blocks": ["ralph-8"],
-            "blockedBy": ["ralph-6.9"]
-        },
-
-        # GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT
-        {
-            "id": "ralph-8",
-            "subject": "GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT - Final validation",
-            "description": f"""## GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT
-
-## 🚨 READ FIRST: Gate Constraints
-
-**BEFORE YOU START:**
-1. Read: `~/.claude/design-ops/enforcement/ralph-constraints.md`
-2. Understand: Your ONE job is to make THIS gate pass
-3. Remember: NO extra features, NO refactoring outside scope
-
-**Rules:**
-- ✅ Fix ONLY what fails validation
-- ✅ Commit after EVERY fix  
-- ✅ Follow ASSESS → FIX → COMMIT → VALIDATE loop
-- ❌ NO adding features
-- ❌ NO refactoring unrelated code
-- ❌ NO optimizing prematurely
-- ❌ NO "I should also..." thoughts
-
-**If validation says "fix X"** → Fix X only. Not X + Y + Z.
-
----
+""" + _TELEMETRY_FOOTER.format(n="7") + """""",
+    "ralph-8": """## GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT
 
+""" + _HEADER + """
 **STATELESS CONTEXT (each iteration sees ONLY):**
 - Latest committed source files: {code_dir}/
 - NO full conversation history
 
 ### Commands:
 ```bash
-{design_ops_script} ai-review {code_dir.parent}
-{design_ops_script} performance-audit {code_dir.parent}
+{design_ops_script} ai-review {project_root}
+{design_ops_script} performance-audit {project_root}
 ```
 
 ### MANDATORY Loop (DO NOT SKIP ANY STEP):
 
 **1. ASSESS:**
 ```bash
-{design_ops_script} ai-review {code_dir.parent}
-{design_ops_script} performance-audit {code_dir.parent}
+{design_ops_script} ai-review {project_root}
+{design_ops_script} performance-audit {project_root}
 ```
 
 **2. IF BOTH PASS:**
@@ -1117,8 +828,8 @@ Write to `.ralph/metrics/gate-7.json` on completion.
 
 **3a. READ REPORTS:**
 ```bash
-cat {code_dir.parent}/.ralph/ai-review-report.md
-cat {code_dir.parent}/.ralph/performance-report.json
+cat {project_root}/.ralph/ai-review-report.md
+cat {project_root}/.ralph/performance-report.json
 ```
 
 **3b. FIX:**
@@ -1145,21 +856,19 @@ git log -1 --oneline
 
 **3e. RE-VALIDATE:**
 ```bash
-{design_ops_script} ai-review {code_dir.parent}
-{design_ops_script} performance-audit {code_dir.parent}
+{design_ops_script} ai-review {project_root}
+{design_ops_script} performance-audit {project_root}
 ```
 
 **3f. LOOP:**
 If still failing, go back to step 3a.
 
 **Final Output:**
-- Security report: {code_dir.parent}/.ralph/ai-review-report.md
-- Performance metrics: {code_dir.parent}/.ralph/performance-report.json
+- Security report: {project_root}/.ralph/ai-review-report.md
+- Performance metrics: {project_root}/.ralph/performance-report.json
 - Production readiness: ✅ or ❌
 
-**Telemetry:**
-Write to `.ralph/metrics/gate-8.json` on completion.
-Write final summary to `.ralph/COMPLETE.md`.
+""" + _TELEMETRY_FOOTER.format(n="8") + """Write final summary to `.ralph/COMPLETE.md`.
 
 **🎉 CONGRATULATIONS - RALPH PIPELINE COMPLETE!**
 
@@ -1170,51 +879,416 @@ Git history shows full audit trail:
 git log --oneline --grep="ralph: GATE"
 ```
 """,
-            "activeForm": "Running GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT",
-            "blocks": [],
-            "blockedBy": ["ralph-7"]
-        }
-    ]
+}
+
+
+# Fingerprint of the gate templates, stored next to tasks.json so an
+# edited template invalidates an otherwise-fresh output file. The
+# leading tag is the on-disk format version: bumping it forces
+# regeneration when the tasks.json layout changes.
+_TEMPLATE_HASH = hashlib.blake2b(
+    ("tasks-v2\n" + "".join(_GATE_DESCRIPTIONS[gate_id] for gate_id in sorted(_GATE_DESCRIPTIONS))).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+_FIELD_RE = re.compile(r"\{([a-z_]+)\}")
+
+def _compile_template(template):
+    """Pre-split a template into (literal, field) pairs.
+
+    str.format re-parses the format string on every call; splitting once
+    at import reduces rendering to a straight join of literals and
+    looked-up params.
+    """
+    parts = []
+    pos = 0
+    for m in _FIELD_RE.finditer(template):
+        parts.append((template[pos:m.start()], m.group(1)))
+        pos = m.end()
+    parts.append((template[pos:], None))
+    return tuple(parts)
+
+_GATE_PARTS = {gate_id: _compile_template(t) for gate_id, t in _GATE_DESCRIPTIONS.items()}
+
+def _render(parts, params):
+    """Join a pre-split template with its field values."""
+    return "".join(
+        literal if field is None else literal + params[field]
+        for literal, field in parts
+    )
+
+
+# One row per gate: (id, subject, activeForm). The pipeline is a strict
+# chain, so blocks/blockedBy are derived from gate order in _render_task
+# instead of being hand-written (and kept in sync) on both sides.
+_GATES = (
+    ("ralph-1", "GATE 1: STRESS_TEST - Check spec completeness",
+     "Running GATE 1: STRESS_TEST"),
+    ("ralph-2", "GATE 2: VALIDATE + SECURITY_SCAN - Check clarity and security",
+     "Running GATE 2: VALIDATE + SECURITY_SCAN"),
+    ("ralph-3", "GATE 3: GENERATE_PRP - Extract Product Requirements Prompt",
+     "Running GATE 3: GENERATE_PRP"),
+    ("ralph-4", "GATE 4: CHECK_PRP - Validate PRP structure",
+     "Running GATE 4: CHECK_PRP"),
+    ("ralph-5", "GATE 5: GENERATE_TESTS - Create test suite",
+     "Running GATE 5: GENERATE_TESTS"),
+    ("ralph-5.5", "GATE 5.5: TEST_VALIDATION + TEST_QUALITY - Validate test suite",
+     "Running GATE 5.5: TEST_VALIDATION + TEST_QUALITY"),
+    ("ralph-5.75", "GATE 5.75: PREFLIGHT - Environment checks",
+     "Running GATE 5.75: PREFLIGHT"),
+    ("ralph-6", "GATE 6: IMPLEMENT_TDD - Write code to pass tests",
+     "Running GATE 6: IMPLEMENT_TDD"),
+    ("ralph-6.5", "GATE 6.5: PARALLEL_CHECKS - Build/Lint/Integration/A11y",
+     "Running GATE 6.5: PARALLEL_CHECKS"),
+    ("ralph-6.9", "GATE 6.9: VISUAL_REGRESSION - Screenshot testing",
+     "Running GATE 6.9: VISUAL_REGRESSION"),
+    ("ralph-7", "GATE 7: SMOKE_TEST - E2E critical paths",
+     "Running GATE 7: SMOKE_TEST"),
+    ("ralph-8", "GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT - Final validation",
+     "Running GATE 8: AI_CODE_REVIEW + PERFORMANCE_AUDIT"),
+)
+
+# Intern the gate strings once at construction: every id recurs in the
+# blocks/blockedBy links and in downstream schedulers, and interned
+# strings make those equality checks pointer comparisons on a single
+# canonical object per id.
+_GATES = tuple(
+    (sys.intern(gate_id), sys.intern(subject), sys.intern(active_form))
+    for gate_id, subject, active_form in _GATES
+)
+
+# True gate precedence, kept in one table with blocks derived by
+# inverting deps in one pass, so the two sides can never drift apart.
+# The pipeline is currently a strict chain: 6.9 (visual regression)
+# stays behind 6.5 because its description reads from 6.5's committed
+# build fixes ("Clean build required for visual tests"). A gate that
+# genuinely fans out only needs its deps row changed here.
+_GATE_DEPS = {
+    sys.intern(gate_id): tuple(sys.intern(dep) for dep in deps)
+    for gate_id, deps in {
+        "ralph-1": (),
+        "ralph-2": ("ralph-1",),
+        "ralph-3": ("ralph-2",),
+        "ralph-4": ("ralph-3",),
+        "ralph-5": ("ralph-4",),
+        "ralph-5.5": ("ralph-5",),
+        "ralph-5.75": ("ralph-5.5",),
+        "ralph-6": ("ralph-5.75",),
+        "ralph-6.5": ("ralph-6",),
+        "ralph-6.9": ("ralph-6.5",),
+        "ralph-7": ("ralph-6.9",),
+        "ralph-8": ("ralph-7",),
+    }.items()
+}
+
+_GATE_BLOCKS = {gate_id: [] for gate_id in _GATE_DEPS}
+for _gate_id, _deps in _GATE_DEPS.items():
+    for _dep in _deps:
+        _GATE_BLOCKS[_dep].append(_gate_id)
+
+
+def _toposort(deps):
+    """Kahn's algorithm over the gate DAG (O(V+E)).
+
+    Runs once at import as a cycle/consistency check; the returned order
+    is a valid execution order for any scheduler walking the edges.
+    """
+    indegree = {gate_id: len(gate_deps) for gate_id, gate_deps in deps.items()}
+    ready = collections.deque(gate_id for gate_id, n in indegree.items() if n == 0)
+    order = []
+    while ready:
+        gate_id = ready.popleft()
+        order.append(gate_id)
+        for successor in _GATE_BLOCKS[gate_id]:
+            indegree[successor] -= 1
+            if indegree[successor] == 0:
+                ready.append(successor)
+    if len(order) != len(deps):
+        raise ValueError("cycle in _GATE_DEPS")
+    return tuple(order)
+
+
+# Topological gate order, derived once from the dependency edges.
+_GATE_ORDER = _toposort(_GATE_DEPS)
+
+# Dependency level per gate (0 = nothing blocking). Stored on each task
+# so schedulers can group ready work without re-walking the edges.
+_GATE_LEVELS = {}
+for _gate_id in _GATE_ORDER:
+    _GATE_LEVELS[_gate_id] = 1 + max(
+        (_GATE_LEVELS[dep] for dep in _GATE_DEPS[_gate_id]), default=-1
+    )
+
+@functools.lru_cache(maxsize=64)
+def _derive_paths(spec_file):
+    """Resolve the spec and its derived paths, cached per spec_file.
+
+    realpath() walks every path component with stat calls; batch callers
+    that regenerate tasks for the same spec repeatedly pay it once.
+    os.path is used over pathlib here: this is the hot derivation and the
+    results are consumed as strings anyway, so there is no reason to
+    allocate a chain of intermediate Path objects.
+    """
+    real = os.path.realpath(spec_file)
+    project_dir = os.path.dirname(os.path.dirname(real))
+    stem = os.path.splitext(os.path.basename(real))[0]
+    return (
+        real,
+        os.path.join(project_dir, "PRPs", stem + "-prp.md"),
+        os.path.join(project_dir, "src"),
+        os.path.join(project_dir, "tests"),
+        project_dir,
+    )
+
+
+def iter_tasks(spec_file, include_description=True):
+    """Yield the 12 RALPH gate tasks one at a time.
+
+    Generator form bounds the working set to a single task: callers that
+    stream to disk never hold more than one rendered description. With
+    include_description=False the descriptions (the bulk of both the CPU
+    and the JSON) are never rendered — metadata-only consumers get just
+    id/subject/activeForm and the dependency links.
+    """
+
+    spec_path, prp_file, code_dir, test_dir, project_dir = _derive_paths(spec_file)
+    if not os.path.exists(spec_path):
+        print(f"❌ Spec file not found: {spec_file}")
+        sys.exit(1)
+
+    if not include_description:
+        for row in _GATES:
+            yield _render_task(None, row)
+        return
+
+    params = {
+        "spec_path": spec_path,
+        "prp_file": prp_file,
+        "code_dir": code_dir,
+        "test_dir": test_dir,
+        "project_root": project_dir,
+        "design_ops_script": _DESIGN_OPS_SCRIPT_STR,
+    }
+
+    # Render the 12 descriptions on a small thread pool; format_map's
+    # allocation-heavy work releases the GIL often enough to overlap, and
+    # ex.map preserves gate order.
+    with ThreadPoolExecutor(max_workers=min(len(_GATES), os.cpu_count() or 1)) as ex:
+        for task in ex.map(functools.partial(_render_task, params), _GATES):
+            yield task
+
+
+def _render_task(params, row):
+    """Build one task dict from its _GATES row and the dependency maps.
+
+    params=None means a slim task: the description is omitted entirely.
+    """
+    gate_id, subject, active_form = row
+    task = {"id": gate_id, "subject": subject}
+    if params is not None:
+        task["description"] = _render(_GATE_PARTS[gate_id], params)
+    task["activeForm"] = active_form
+    task["blocks"] = list(_GATE_BLOCKS[gate_id])
+    task["blockedBy"] = list(_GATE_DEPS[gate_id])
+    task["level"] = _GATE_LEVELS[gate_id]
+    return task
+
 
-    return tasks
+def generate_tasks(spec_file):
+    """Generate all 12 RALPH gates as task definitions with MANDATORY git commits.
+
+    The result is frozen — a tuple of read-only mapping views — since
+    callers retain it without mutating: long-lived orchestrator
+    processes keep fewer mutable objects for the cyclic GC to re-scan.
+    (The JSON writer streams the plain dicts from iter_tasks instead;
+    stdlib json cannot serialize mappingproxy objects.)
+    """
+    return tuple(types.MappingProxyType(t) for t in iter_tasks(spec_file))
 
 
 def main():
-    if len(sys.argv) < 2:
+    # --verify-commit <subject>: check one commit subject against the
+    # gate convention, e.g. from a gate's VERIFY step:
+    #   git log -1 --format=%s | xargs -d '\n' python ralph-orchestrator-v2.py --verify-commit
+    if sys.argv[1:2] == ["--verify-commit"]:
+        subject = sys.argv[2] if len(sys.argv) > 2 else ""
+        match = VERIFY_COMMIT_RE.match(subject)
+        if match is None:
+            print(f"❌ Not a gate commit subject: {subject!r}")
+            sys.exit(1)
+        print(f"✅ GATE {match.group(1)}: {match.group(2)}")
+        return
+
+    # Check the argument list after stripping flags, so a bare
+    # "--dry-run" without a spec file gets the usage message too.
+    args = [arg for arg in sys.argv[1:] if arg != "--dry-run"]
+    if not args:
         print("Usage: python ralph-orchestrator-v2.py <spec-file>")
         print("\nExample:")
         print("  python ralph-orchestrator-v2.py specs/S-001-feature.md")
         sys.exit(1)
 
-    spec_file = sys.argv[1]
-
-    print("=" * 80)
-    print("RALPH ORCHESTRATOR V2 - Task Generation")
-    print("🚨 GIT COMMITS NOW MANDATORY AND EXPLICIT")
-    print("=" * 80)
-    print(f"\nSpec file: {spec_file}")
-
-    tasks = generate_tasks(spec_file)
+    spec_file = args[0]
+
+    # Fail fast on a missing gate script rather than after writing tasks
+    # that can only error out. Warning, not exit: task generation itself
+    # works without it, and CI may generate on one host and run on
+    # another. On stderr so the --dry-run JSON stream stays parseable.
+    if not _DESIGN_OPS_SCRIPT.exists():
+        print(f"⚠️  design-ops script not found: {_DESIGN_OPS_SCRIPT}", file=sys.stderr)
+        print("   Set DESIGN_OPS_ROOT to point at your design-ops install.", file=sys.stderr)
+
+    # --dry-run: metadata-only listing to stdout. Skips description
+    # rendering entirely — callers that just need ids and dependency
+    # links (CI listings, the task loader's scan) pay none of the
+    # formatting cost.
+    if "--dry-run" in sys.argv:
+        out = sys.stdout.buffer
+        out.write(b"[\n")
+        for index, task in enumerate(iter_tasks(spec_file, include_description=False)):
+            if index:
+                out.write(b",\n")
+            out.write(_dumps_indented(task))
+        out.write(b"\n]\n")
+        return
+
+    # One write per banner block: each print takes the stdout lock and
+    # flushes line-buffered streams, which adds up under CI log pipes.
+    sys.stdout.write("\n".join((
+        "=" * 80,
+        "RALPH ORCHESTRATOR V2 - Task Generation",
+        "🚨 GIT COMMITS NOW MANDATORY AND EXPLICIT",
+        "=" * 80,
+        f"\nSpec file: {spec_file}",
+    )) + "\n")
 
     # Output task JSON for Claude Code to consume
     output_file = Path(".ralph/tasks.json")
-    output_file.parent.mkdir(exist_ok=True)
 
-    with open(output_file, 'w') as f:
-        json.dump(tasks, f, indent=2)
-
-    print(f"\n✅ Generated {len(tasks)} tasks with MANDATORY git commits")
-    print(f"📄 Task definitions written to: {output_file}")
-    print("\nKey changes in V2:")
-    print("  🚨 Git commits are now MANDATORY (bold, caps, explicit)")
-    print("  🚨 Each commit has VERIFY step (git log check)")
-    print("  🚨 WHY COMMIT IS MANDATORY section explains reason")
-    print("  🚨 GATE 6: Commit after EACH test (not end of gate)")
-    print("\nNext steps:")
-    print("1. Review .ralph/tasks.json")
-    print("2. In Claude Code, run:")
-    print("   python ~/.claude/design-ops/enforcement/ralph-task-loader.py")
-    print("\nTasks will enforce git commits at every fix iteration.")
+    # Validate the spec before scheduling any write, so a missing spec
+    # fails here instead of after the summary has claimed success.
+    spec_path = _derive_paths(spec_file)[0]
+    if not os.path.exists(spec_path):
+        print(f"❌ Spec file not found: {spec_file}")
+        sys.exit(1)
+
+    # Parse only if necessary: a fresh output with matching templates
+    # makes the whole run a pair of stat() calls.
+    if _up_to_date(spec_file, output_file):
+        print(f"♻️  Spec unchanged - keeping existing {output_file}")
+        print(f"\n✅ {len(_GATES)} tasks already up to date")
+        return
+
+    asyncio.run(_write_and_report(spec_file, output_file))
+
+
+def _meta_file(output_file):
+    return output_file.with_name(output_file.name + ".meta")
+
+
+def _stamp(spec_file):
+    """Freshness stamp stored in the .meta file.
+
+    Template hash, the mtime of this source file, and the resolved spec
+    path with its mtime: a template edit is caught by the hash, any
+    other orchestrator change (renderer, path derivation, output
+    format) by the source mtime, and editing the spec — or pointing the
+    orchestrator at a different spec — by the spec component.
+    """
+    spec_path = _derive_paths(spec_file)[0]
+    return (
+        f"{_TEMPLATE_HASH}:{os.stat(__file__).st_mtime_ns}"
+        f":{spec_path}:{os.stat(spec_path).st_mtime_ns}"
+    )
+
+
+def _up_to_date(spec_file, output_file):
+    """True when tasks.json exists and was produced from this exact spec
+    by this exact orchestrator (stamp stored in a sibling .meta file)."""
+    try:
+        os.stat(output_file)
+        return _meta_file(output_file).read_text().strip() == _stamp(spec_file)
+    except OSError:
+        return False
+
+
+def _write_tasks(spec_file, output_file):
+    """Stream tasks to output_file one array element at a time.
+
+    Returns the number of tasks written. Runs in a worker thread so the
+    disk writes overlap with the summary going to stdout.
+    """
+    output_file.parent.mkdir(exist_ok=True)
+    # Write to a sibling tmp file and os.replace into place: a reader (or
+    # a kill mid-write) never sees a half-written tasks.json.
+    tmp_file = output_file.with_suffix(".json.tmp")
+    # Collect the tasks only when the msgpack sidecar will be written;
+    # otherwise the streaming writer keeps its single-task working set.
+    collected = [] if _packb is not None else None
+    shared = {"gate_header": _HEADER}
+    task_count = 0
+    try:
+        with open(tmp_file, 'wb') as f:
+            # Object form: the gate header is stored once under "shared"
+            # and referenced by marker from each description, which
+            # shrinks the file by ~12 header copies. The loader splices
+            # it back.
+            f.write(b'{\n"shared": ')
+            f.write(_dumps_indented(shared))
+            f.write(b',\n"tasks": [\n')
+            for task in iter_tasks(spec_file):
+                task["description"] = task["description"].replace(_HEADER, _HEADER_MARKER)
+                if task_count:
+                    f.write(b",\n")
+                f.write(_dumps_indented(task))
+                task_count += 1
+                if collected is not None:
+                    collected.append(task)
+            f.write(b"\n]\n}\n")
+    except BaseException:
+        # BaseException: iter_tasks sys.exit()s on a vanished spec, and
+        # even then the partial tmp file must not be left behind.
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp_file, output_file)
+    if collected is not None:
+        # Written after the JSON so its mtime is never older - the
+        # loader only trusts a sidecar at least as fresh as tasks.json.
+        # Same write-then-rename dance as tasks.json itself.
+        sidecar_tmp = output_file.with_suffix(".msgpack.tmp")
+        sidecar_tmp.write_bytes(_packb({"shared": shared, "tasks": collected}))
+        os.replace(sidecar_tmp, output_file.with_suffix(".msgpack"))
+    _meta_file(output_file).write_text(_stamp(spec_file) + "\n")
+    return task_count
+
+
+async def _write_and_report(spec_file, output_file):
+    """Overlap the tasks.json write with the stdout summary."""
+    loop = asyncio.get_event_loop()
+    write = loop.run_in_executor(None, _write_tasks, spec_file, output_file)
+
+    # Static notes, emitted as a single write while the worker thread
+    # is on the file syscalls (which release the GIL). Only informative
+    # text here — anything claiming success waits for the write.
+    sys.stdout.write("\n".join((
+        "Key changes in V2:",
+        "  🚨 Git commits are now MANDATORY (bold, caps, explicit)",
+        "  🚨 Each commit has VERIFY step (git log check)",
+        "  🚨 WHY COMMIT IS MANDATORY section explains reason",
+        "  🚨 GATE 6: Commit after EACH test (not end of gate)",
+        "\nNext steps:",
+        "1. Review .ralph/tasks.json",
+        "2. In Claude Code, run:",
+        "   python ~/.claude/design-ops/enforcement/ralph-task-loader.py",
+        "\nTasks will enforce git commits at every fix iteration.",
+    )) + "\n")
+
+    task_count = await write
+    print(f"\n📄 Task definitions written to: {output_file}")
+    print(f"✅ Generated {task_count} tasks with MANDATORY git commits")
 
 
 if __name__ == "__main__":
@@ -11,9 +11,48 @@ Usage:
 """
 
 import json
+import os
 from pathlib import Path
 import sys
 
+# Deserialization: orjson (C implementation) when installed, stdlib json
+# otherwise — same opportunistic shim as the orchestrators.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# The orchestrator writes a msgpack sidecar when the package is
+# installed; decoding it is several times faster than parsing the
+# indented JSON and the binary form is smaller to read.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _assemble(data):
+    """Return the task list with full descriptions.
+
+    Newer files are an object with a "shared" fragment map (the gate
+    header is stored once and referenced by a {{name}} marker line in
+    each description); older files are a plain task array.
+    """
+    if not isinstance(data, dict):
+        return data
+    shared = data.get('shared', {})
+    tasks = data['tasks']
+    for task in tasks:
+        description = task.get('description')
+        if description is None:
+            continue
+        for name, text in shared.items():
+            description = description.replace('{{' + name + '}}\n', text)
+        task['description'] = description
+    return tasks
+
 
 def load_tasks():
     """Load task definitions from .ralph/tasks.json"""
@@ -26,47 +65,114 @@ def load_tasks():
         print("  python ~/.claude/design-ops/enforcement/ralph-orchestrator.py specs/feature.md")
         sys.exit(1)
 
-    with open(tasks_file) as f:
-        tasks = json.load(f)
+    # Prefer the msgpack sidecar when it is at least as fresh as the
+    # JSON (the orchestrator writes it second, so a stale sidecar only
+    # means tasks.json was regenerated without msgpack installed).
+    if msgpack is not None:
+        sidecar = tasks_file.with_suffix(".msgpack")
+        try:
+            if sidecar.stat().st_mtime_ns >= tasks_file.stat().st_mtime_ns:
+                return _assemble(msgpack.unpackb(sidecar.read_bytes()))
+        except OSError:
+            pass
+
+    # One read of the raw bytes; both parsers take bytes directly, so no
+    # intermediate text decode pass.
+    tasks = _assemble(_loads(tasks_file.read_bytes()))
 
     return tasks
 
 
-def format_task_creation_instructions(tasks):
-    """Format instructions for Claude Code to create tasks"""
-
-    instructions = """# RALPH Pipeline Task Creation
+_INSTRUCTIONS_HEADER = """# RALPH Pipeline Task Creation
 
 I need you to create the following tasks using the TaskCreate tool.
 
-**IMPORTANT**: Create ALL tasks in a SINGLE message with multiple TaskCreate tool calls.
+**IMPORTANT**: Create tasks one dependency level at a time. Submit each
+level's TaskCreate calls in a SINGLE message, then move to the next
+level — level 0 tasks can start executing while later levels are still
+being created.
 
 Here are the tasks to create:
 
 """
 
-    for task in tasks:
-        instructions += f"""
-## Task {task['id']}: {task['subject']}
+# Per-task block, hoisted so each task is one C-level format_map pass
+# over the task dict instead of f-string bytecode plus six __getitem__
+# calls per interpolation.
+_TASK_TMPL = """
+## Task {id}: {subject}
 
 ```
 TaskCreate(
-    subject="{task['subject']}",
+    subject="{subject}",
     description='''
-{task['description']}
+{description}
 ''',
-    activeForm="{task['activeForm']}"
+    activeForm="{activeForm}"
 )
 ```
 
 After creation, update with dependencies:
-- blocks: {task['blocks']}
-- blockedBy: {task['blockedBy']}
+- blocks: {blocks}
+- blockedBy: {blockedBy}
 
 ---
 """
 
-    instructions += """
+
+class _TaskFields(dict):
+    """Task dict wrapper that renders absent fields as empty strings.
+
+    _assemble() tolerates tasks without a description (and older files
+    may lack other optional fields); format_map must do the same instead
+    of raising KeyError mid-document.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return ""
+
+
+def _dag_levels(tasks):
+    """Group tasks into dependency levels (level 0 = nothing blocking).
+
+    Newer tasks.json files carry a precomputed "level" field from the
+    orchestrator; older ones fall back to a one-pass derivation, which
+    works because tasks.json is written in topological order (a task's
+    blockers are always assigned a level before the task itself).
+    """
+    level_of = {}
+    levels = []
+    for task in tasks:
+        level = task.get('level')
+        if level is None:
+            level = 0
+            for dep in task['blockedBy']:
+                level = max(level, level_of[dep] + 1)
+        level_of[task['id']] = level
+        while level >= len(levels):
+            levels.append([])
+        levels[level].append(task)
+    return levels
+
+
+def format_task_creation_instructions(tasks):
+    """Format instructions for Claude Code to create tasks"""
+
+    # Accumulate fragments and join once: += on a growing string is only
+    # linear when CPython's in-place resize trick applies, and this
+    # builds a ~40KB document.
+    parts = [_INSTRUCTIONS_HEADER]
+
+    for level, level_tasks in enumerate(_dag_levels(tasks)):
+        parts.append(f"""
+# --- Level {level} --- (create these {len(level_tasks)} in one message, then submit)
+""")
+        for task in level_tasks:
+            parts.append(_TASK_TMPL.format_map(_TaskFields(task)))
+
+    parts.append("""
 
 ## After Creating All Tasks
 
@@ -90,9 +196,9 @@ Use `/tasks` command to see current status:
 - pending: Waiting for dependencies
 - in_progress: Currently running
 - completed: Passed and committed
-"""
+""")
 
-    return instructions
+    return "".join(parts)
 
 
 def main():
@@ -106,33 +212,45 @@ def main():
 
     instructions = format_task_creation_instructions(tasks)
 
-    # Write instructions to file for Claude Code to read
+    # Write instructions to file for Claude Code to read. Skip the write
+    # when the content is identical so file-watchers (VS Code, Claude
+    # Code polling) don't get invalidated by a byte-for-byte rewrite.
     instruction_file = Path(".ralph/task-creation-instructions.md")
-    with open(instruction_file, 'w') as f:
-        f.write(instructions)
-
-    print(f"📄 Task creation instructions written to: {instruction_file}")
+    new_bytes = instructions.encode("utf-8")
+    try:
+        unchanged = instruction_file.read_bytes() == new_bytes
+    except OSError:
+        unchanged = False
+    if unchanged:
+        print(f"📄 Task creation instructions unchanged: {instruction_file}")
+    else:
+        # Write-then-rename: a concurrent reader never sees a torn file.
+        tmp_file = instruction_file.with_suffix(".md.tmp")
+        tmp_file.write_bytes(new_bytes)
+        os.replace(tmp_file, instruction_file)
+        print(f"📄 Task creation instructions written to: {instruction_file}")
     print("\n" + "=" * 80)
     print("INSTRUCTIONS FOR CLAUDE CODE")
     print("=" * 80)
     print("\nPlease read the following file and create all tasks as specified:")
     print(f"  {instruction_file}")
     print("\nKey points:")
-    print("  • Create ALL 12 tasks in a SINGLE message with multiple TaskCreate calls")
+    print("  • Create tasks level by level - each level's TaskCreate calls in ONE message")
     print("  • Then use TaskUpdate to set up blocks/blockedBy dependencies")
     print("  • Verify with TaskList that all tasks are created correctly")
     print("  • Tasks will auto-execute as dependencies complete")
     print("\n" + "=" * 80)
 
-    # Also print the tasks summary
-    print("\nTask Summary:")
-    print("-" * 80)
+    # Also print the tasks summary - buffered into one write instead of
+    # two print calls (lock + flush each) per task.
+    lines = ["\nTask Summary:\n", "-" * 80 + "\n"]
     for task in tasks:
         status_icon = "🔒" if task['blockedBy'] else "🟢"
-        print(f"{status_icon} {task['id']}: {task['subject']}")
+        lines.append(f"{status_icon} {task['id']}: {task['subject']}\n")
         if task['blockedBy']:
-            print(f"   ↳ Blocked by: {', '.join(task['blockedBy'])}")
-    print("-" * 80)
+            lines.append(f"   ↳ Blocked by: {', '.join(task['blockedBy'])}\n")
+    lines.append("-" * 80 + "\n")
+    sys.stdout.write("".join(lines))
 
 
 if __name__ == "__main__":